@@ -1,39 +1,95 @@
 from __future__ import annotations
 
-import os
-from typing import List
+import functools
+from typing import Dict, List, Optional, Type
 
 from langchain.chat_models import init_chat_model
-from langsmith import Client  # noqa: F401 (import ensures availability when env is set)
-from langgraph.prebuilt import create_react_agent
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.prebuilt import ToolNode, create_react_agent
 from langchain_google_community import CalendarToolkit
 from langchain_core.tools import BaseTool
 
+from .batch_tools import CalendarBatchCreateEvents, CalendarBatchGetEvents
+from .calendar_service import build_calendar_service
+from .settings import get_settings
 
+
+# Single tool instances reused by direct commands (quick-create, list-calendars)
+_TOOL_INSTANCES: Dict[Type[BaseTool], BaseTool] = {}
+
+
+def get_model_name() -> str:
+    return get_settings().gemini_model
+
+
+@functools.lru_cache(maxsize=1)
 def build_calendar_tools() -> List[BaseTool]:
     """Create and return Google Calendar toolkit tools.
 
     Authentication flow uses local credentials.json and generates token.json on first run.
-    Customize by passing a pre-built api_resource if needed.
+    The result is cached so the OAuth/discovery round-trip happens once per process.
+    All tools, including the batch tools, share one api_resource and its HTTP connections.
     """
-    toolkit = CalendarToolkit()
-    return toolkit.get_tools()
+    toolkit = CalendarToolkit(api_resource=build_calendar_service())
+    return toolkit.get_tools() + [
+        CalendarBatchCreateEvents(api_resource=toolkit.api_resource),
+        CalendarBatchGetEvents(api_resource=toolkit.api_resource),
+    ]
+
+
+def get_calendar_tool(tool_cls: Type[BaseTool]) -> BaseTool:
+    """Return a cached instance of a Calendar tool class, shared with the toolkit when possible."""
+    tool = _TOOL_INSTANCES.get(tool_cls)
+    if tool is None:
+        tool = next((t for t in build_calendar_tools() if isinstance(t, tool_cls)), None) or tool_cls()
+        _TOOL_INSTANCES[tool_cls] = tool
+    return tool
+
+
+@functools.lru_cache(maxsize=1)
+def _init_llm(model_name: str) -> any:
+    return init_chat_model(model_name, model_provider="google_genai")
 
 
-def build_llm() -> any:
+def build_llm(model_name: Optional[str] = None) -> any:
     """Initialize the chat model using Google Gemini via LangChain init_chat_model.
 
     Requires environment variable GOOGLE_API_KEY to be set.
+    Instances are cached per model name.
     """
-    model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
-    return init_chat_model(model_name, model_provider="google_genai")
+    return _init_llm(model_name or get_model_name())
 
 
-def build_agent_executor():
+@functools.lru_cache(maxsize=1)
+def _build_agent_executor(model_name: str):
     # Optional: LangSmith config is picked from env vars if provided
     # LANGSMITH_TRACING, LANGSMITH_API_KEY, LANGSMITH_PROJECT, LANGSMITH_ENDPOINT
+    if (get_settings().langsmith_tracing or "").lower() == "true":
+        import langsmith  # noqa: F401 (import ensures availability when tracing is enabled)
+    # ToolNode runs the tool calls of a single model turn concurrently when driven via astream/ainvoke
+    # MemorySaver keeps conversation state per thread_id so callers only send new messages
     tools = build_calendar_tools()
-    llm = build_llm()
-    agent_executor = create_react_agent(llm, tools)
+    llm = build_llm(model_name)
+    agent_executor = create_react_agent(llm, ToolNode(tools), checkpointer=MemorySaver())
     return agent_executor
 
+
+def build_agent_executor(model_name: Optional[str] = None):
+    """Build (or reuse) the ReAct agent for the configured Gemini model."""
+    return _build_agent_executor(model_name or get_model_name())
+
+
+def build_semantic_cache():
+    """Return a SemanticCache when CALENDAR_CLI_SEMANTIC_CACHE=1 and it can be opened, otherwise None."""
+    if not get_settings().calendar_cli_semantic_cache:
+        return None
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+    from .cache import DEFAULT_EMBEDDING_MODEL, SemanticCache
+
+    try:
+        embeddings = GoogleGenerativeAIEmbeddings(model=DEFAULT_EMBEDDING_MODEL)
+        return SemanticCache(embeddings.embed_query)
+    except Exception:
+        # The cache is an optimization; an unusable cache DB must not stop the chat
+        return None
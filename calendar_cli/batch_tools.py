@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from langchain_google_community.calendar.base import CalendarBaseTool
+from pydantic import BaseModel, Field
+
+
+# Google Calendar accepts at most 50 calls per batch request
+MAX_BATCH_SIZE = 50
+
+
+class EventPayload(BaseModel):
+    summary: str = Field(..., description="Event title")
+    start_datetime: str = Field(..., description="Start datetime, format 'YYYY-MM-DD HH:MM:SS'")
+    end_datetime: str = Field(..., description="End datetime, format 'YYYY-MM-DD HH:MM:SS'")
+    timezone: str = Field(default="Etc/UTC", description="IANA timezone, e.g., Europe/Istanbul")
+    calendar_id: str = Field(default="primary", description="Calendar id")
+    location: Optional[str] = Field(default=None, description="Event location")
+    description: Optional[str] = Field(default=None, description="Event description")
+    color_id: Optional[str] = Field(default=None, description="Google Calendar color id (1-11)")
+
+
+class BatchCreateSchema(BaseModel):
+    events: List[EventPayload] = Field(..., description="Events to create in one batch")
+
+
+class BatchGetSchema(BaseModel):
+    event_ids: List[str] = Field(..., description="Event ids to fetch in one batch")
+    calendar_id: str = Field(default="primary", description="Calendar id")
+
+
+def _chunks(items: List[Any], size: int = MAX_BATCH_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def parse_event_datetime(value: str) -> datetime:
+    """Parse 'YYYY-MM-DD HH:MM[:SS]' ('T' separator and a UTC offset allowed); raises ValueError if invalid."""
+    if len(value) < len("YYYY-MM-DD HH:MM"):
+        raise ValueError(f"invalid datetime: {value}")
+    return datetime.fromisoformat(value)
+
+
+def _event_body(event: EventPayload) -> Dict[str, Any]:
+    # Client-generated id (hex is valid base32hex) makes retried inserts idempotent: a 409 means it exists
+    body: Dict[str, Any] = {"id": uuid.uuid4().hex, "summary": event.summary}
+    for key, value in (("start", event.start_datetime), ("end", event.end_datetime)):
+        body[key] = {"dateTime": parse_event_datetime(value).isoformat(), "timeZone": event.timezone}
+    if event.location:
+        body["location"] = event.location
+    if event.description:
+        body["description"] = event.description
+    if event.color_id:
+        body["colorId"] = event.color_id
+    return body
+
+
+def _summarize(response: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": response.get("id"),
+        "summary": response.get("summary"),
+        "start": response.get("start"),
+        "end": response.get("end"),
+        "htmlLink": response.get("htmlLink"),
+    }
+
+
+def _is_conflict(exception: Exception) -> bool:
+    return getattr(getattr(exception, "resp", None), "status", None) == 409
+
+
+def execute_in_batches(
+    api_resource: Any,
+    requests: List[Any],
+    transform: Callable[[Dict[str, Any]], Dict[str, Any]] = _summarize,
+) -> List[Dict[str, Any]]:
+    """Execute googleapiclient requests via BatchHttpRequest, preserving input order.
+
+    If a whole batch fails, only the requests without a callback result are retried one by one.
+    """
+    results: List[Dict[str, Any]] = []
+    for chunk in _chunks(requests):
+        chunk_results: Dict[str, Dict[str, Any]] = {}
+
+        def callback(request_id, response, exception):
+            if exception is not None:
+                chunk_results[request_id] = {"error": str(exception)}
+            else:
+                chunk_results[request_id] = transform(response)
+
+        batch = api_resource.new_batch_http_request(callback=callback)
+        for idx, request in enumerate(chunk):
+            batch.add(request, request_id=str(idx))
+        try:
+            batch.execute()
+        except Exception:
+            for idx, request in enumerate(chunk):
+                if str(idx) in chunk_results:
+                    continue
+                try:
+                    chunk_results[str(idx)] = transform(request.execute())
+                except Exception as e:
+                    # The failed batch may have applied the insert already
+                    chunk_results[str(idx)] = {"status": "already exists"} if _is_conflict(e) else {"error": str(e)}
+        results.extend(chunk_results.get(str(idx), {"error": "no response"}) for idx in range(len(chunk)))
+    return results
+
+
+class CalendarBatchCreateEvents(CalendarBaseTool):
+    """Create many events with a single Calendar batch request."""
+
+    name: str = "calendar_batch_create"
+    description: str = (
+        "Use this tool to create two or more events at once. "
+        "It sends all events in one batch request instead of one request per event."
+    )
+    args_schema: Type[BaseModel] = BatchCreateSchema
+
+    def _run(self, events: List[EventPayload], run_manager: Optional[Any] = None) -> str:
+        events = [e if isinstance(e, EventPayload) else EventPayload.model_validate(e) for e in events]
+        bodies = [_event_body(e) for e in events]
+        requests = [
+            self.api_resource.events().insert(calendarId=e.calendar_id, body=body) for e, body in zip(events, bodies)
+        ]
+        results = execute_in_batches(self.api_resource, requests)
+        for body, result in zip(bodies, results):
+            result.setdefault("id", body["id"])
+        return json.dumps(results, ensure_ascii=False)
+
+
+class CalendarBatchGetEvents(CalendarBaseTool):
+    """Fetch many events by id with a single Calendar batch request."""
+
+    name: str = "calendar_batch_get"
+    description: str = (
+        "Use this tool to get the details of two or more events by id at once. "
+        "It sends all lookups in one batch request instead of one request per event."
+    )
+    args_schema: Type[BaseModel] = BatchGetSchema
+
+    def _run(self, event_ids: List[str], calendar_id: str = "primary", run_manager: Optional[Any] = None) -> str:
+        requests = [self.api_resource.events().get(calendarId=calendar_id, eventId=eid) for eid in event_ids]
+        # Return the full event resources (description, location, attendees, ...)
+        results = execute_in_batches(self.api_resource, requests, transform=dict)
+        return json.dumps(results, ensure_ascii=False)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import csv
+import json
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .batch_tools import EventPayload, parse_event_datetime
+
+
+BATCH_DONE_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+BULK_EVENT_PROMPT = """Convert the event below into a single JSON object with keys:
+summary, start_datetime, end_datetime, timezone, location, description, color_id.
+Datetimes use the format 'YYYY-MM-DD HH:MM:SS'. Use null for unknown optional fields.
+Default timezone: {timezone}. Today is {today}. If no end is given, the event lasts 30 minutes.
+
+Event: {row}"""
+
+
+def read_event_rows(path: Path) -> List[str]:
+    """Read events from CSV (header row), JSONL, or plain text (one event per line)."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            return [json.dumps(row, ensure_ascii=False) for row in csv.DictReader(f)]
+        lines = [(lineno, line.strip()) for lineno, line in enumerate(f, 1) if line.strip()]
+    if path.suffix.lower() == ".jsonl":
+        # Validate and normalize each JSON line
+        rows: List[str] = []
+        for lineno, line in lines:
+            try:
+                rows.append(json.dumps(json.loads(line), ensure_ascii=False))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{lineno}: invalid JSON: {e}") from None
+        return rows
+    return [line for _, line in lines]
+
+
+def build_batch_requests(rows: List[str], timezone: str) -> List[Dict[str, Any]]:
+    today = date.today().isoformat()
+    return [
+        {
+            "contents": [
+                {"role": "user", "parts": [{"text": BULK_EVENT_PROMPT.format(timezone=timezone, today=today, row=row)}]}
+            ],
+            "config": {"response_mime_type": "application/json"},
+        }
+        for row in rows
+    ]
+
+
+def run_gemini_batch(requests: List[Dict[str, Any]], model: str, max_wait: float = 3600.0) -> Any:
+    """Submit inline requests to the Gemini Batch API and poll with exponential backoff."""
+    from google import genai
+
+    client = genai.Client()
+    job = client.batches.create(model=model, src=requests, config={"display_name": "calendar-cli-bulk-create"})
+    delay, waited = 2.0, 0.0
+    while job.state.name not in BATCH_DONE_STATES:
+        if waited >= max_wait:
+            raise TimeoutError(f"Batch {job.name} still {job.state.name} after {int(waited)}s")
+        time.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, 60.0)
+        job = client.batches.get(name=job.name)
+    if job.state.name != "JOB_STATE_SUCCEEDED":
+        raise RuntimeError(f"Batch {job.name} ended with {job.state.name}: {job.error}")
+    return job
+
+
+def parse_batch_events(
+    job: Any, rows: List[str], timezone: str
+) -> Tuple[List[EventPayload], List[Tuple[str, str]]]:
+    """Turn inlined batch responses into EventPayloads; returns (events, [(row, error), ...]).
+
+    Datetimes are checked here so one malformed row is skipped instead of failing the Calendar batch.
+    Rows without a timezone get the one the command resolved, and rows the batch returned
+    no response for are reported as errors.
+    """
+    events: List[EventPayload] = []
+    errors: List[Tuple[str, str]] = []
+    responses = list(getattr(job.dest, "inlined_responses", None) or [])
+    for idx, row in enumerate(rows):
+        if idx >= len(responses):
+            errors.append((row, "no response from the Gemini batch"))
+            continue
+        item = responses[idx]
+        if item.error:
+            errors.append((row, str(item.error)))
+            continue
+        try:
+            data = json.loads(item.response.text)
+            data = {k: v for k, v in data.items() if v is not None}
+            data.setdefault("timezone", timezone)
+            event = EventPayload.model_validate(data)
+            parse_event_datetime(event.start_datetime)
+            parse_event_datetime(event.end_datetime)
+            events.append(event)
+        except Exception as e:
+            errors.append((row, str(e)))
+    return events, errors
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+
+DEFAULT_CACHE_PATH = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "calendar_cli" / "semantic_cache.sqlite3"
+DEFAULT_EMBEDDING_MODEL = "models/text-embedding-004"
+DEFAULT_THRESHOLD = 0.92
+# Calendar answers go stale; only reuse recent ones
+DEFAULT_TTL_SECONDS = 300
+
+# Prompts that ask for calendar changes must always reach the agent.
+# Matched at the start of a word so Turkish suffixes still count ("koyar mısın", "planla").
+SIDE_EFFECT_WORDS = (
+    "oluştur", "sil", "güncelle", "taşı", "ekle", "iptal", "ertele", "koy", "planla", "ayarla",
+    "değiştir", "kaydır", "davet", "ayır", "kaldır", "ötele", "öne çek", "geri çek",
+    "create", "delete", "remove", "update", "move", "add", "schedule", "cancel", "book", "set up",
+    "reschedule", "put", "plan", "rename", "invite", "change", "block", "push", "postpone", "shift",
+)
+
+
+def fold_text(text: str) -> str:
+    """Case-fold for matching; dotted/dotless I fold to 'i' ("İptal".lower() would give "i̇ptal")."""
+    return text.replace("İ", "i").replace("I", "i").replace("ı", "i").casefold()
+
+
+# Too short to match as a prefix ("all", "alarm"); matched as whole words only
+SIDE_EFFECT_WHOLE_WORDS = ("al", "alın", "alır mısın", "alabilir misin")
+
+_SIDE_EFFECT_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(fold_text(w)) for w in SIDE_EFFECT_WORDS) + ")"
+    r"|\b(?:" + "|".join(re.escape(fold_text(w)) for w in SIDE_EFFECT_WHOLE_WORDS) + r")\b"
+)
+
+# Only turns whose tool calls all come from this set are stored
+READ_ONLY_TOOL_NAMES = frozenset({"get_calendars_info", "search_events", "get_current_datetime", "calendar_batch_get"})
+# Short replies ("E", "H", "evet") only make sense next to the previous answer
+MIN_PROMPT_WORDS = 3
+
+
+def has_side_effects(prompt: str) -> bool:
+    return _SIDE_EFFECT_RE.search(fold_text(prompt)) is not None
+
+
+def is_cacheable_prompt(prompt: str) -> bool:
+    return len(prompt.split()) >= MIN_PROMPT_WORDS and not has_side_effects(prompt)
+
+
+def is_read_only_turn(messages: Iterable[Any]) -> bool:
+    """True if no AI message after the last human message called a tool outside READ_ONLY_TOOL_NAMES."""
+    turn: List[Any] = []
+    for message in messages:
+        if getattr(message, "type", None) == "human":
+            turn = []
+        else:
+            turn.append(message)
+    return all(
+        call.get("name") in READ_ONLY_TOOL_NAMES
+        for message in turn
+        for call in (getattr(message, "tool_calls", None) or [])
+    )
+
+
+def context_key(previous_answer: Optional[str]) -> str:
+    """Key for the preceding exchange; entries only match prompts asked after the same answer."""
+    if not previous_answer:
+        return ""
+    return hashlib.sha1(previous_answer.encode("utf-8")).hexdigest()
+
+
+def _normalize(vector: List[float]) -> array:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return array("f", (x / norm for x in vector))
+
+
+class SemanticCache:
+    """SQLite-backed cache of (prompt embedding, response) pairs with cosine-similarity lookup.
+
+    Entries are keyed by the preceding exchange (see context_key) as well as the prompt.
+    lookup/store are best-effort: embedding or SQLite errors count as a miss / are skipped.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], List[float]],
+        path: Optional[Path] = None,
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ):
+        self.embed = embed
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        target = Path(path or DEFAULT_CACHE_PATH)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(target))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(context TEXT, prompt TEXT, embedding BLOB, response TEXT, created_at REAL)"
+        )
+        self.conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - ttl_seconds,))
+        self.conn.commit()
+        # Embeddings are kept in memory; the table is small and only holds recent entries
+        self.entries: List[Tuple[str, array, str, float]] = []
+        rows = self.conn.execute("SELECT context, embedding, response, created_at FROM responses")
+        for context, blob, response, created_at in rows:
+            vector = array("f")
+            vector.frombytes(blob)
+            self.entries.append((context, vector, response, created_at))
+
+    def lookup(self, prompt: str, context: str = "") -> Tuple[Optional[str], Optional[array]]:
+        """Return (cached response or None, prompt embedding to reuse for store)."""
+        if not is_cacheable_prompt(prompt):
+            return None, None
+        try:
+            query = _normalize(self.embed(prompt))
+        except Exception:
+            return None, None
+        cutoff = time.time() - self.ttl_seconds
+        best_score, best_response = 0.0, None
+        for entry_context, vector, response, created_at in self.entries:
+            if created_at < cutoff or entry_context != context:
+                continue
+            score = sum(a * b for a, b in zip(query, vector))
+            if score > best_score:
+                best_score, best_response = score, response
+        if best_score >= self.threshold:
+            return best_response, query
+        return None, query
+
+    def store(self, prompt: str, response: str, embedding: Optional[array] = None, context: str = "") -> None:
+        if not is_cacheable_prompt(prompt):
+            return
+        created_at = time.time()
+        try:
+            vector = embedding if embedding is not None else _normalize(self.embed(prompt))
+            self.conn.execute(
+                "INSERT INTO responses (context, prompt, embedding, response, created_at) VALUES (?, ?, ?, ?, ?)",
+                (context, prompt, vector.tobytes(), response, created_at),
+            )
+            self.conn.commit()
+        except Exception:
+            return
+        self.entries.append((context, vector, response, created_at))
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import google_auth_httplib2
+import httplib2
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+from langchain_google_community.calendar.utils import get_google_credentials
+
+
+HTTP_TIMEOUT_SECONDS = 60
+
+# httplib2.Http is not thread-safe, and ToolNode runs sync tools in worker threads.
+# Each thread keeps its own authorized Http, which reuses its keep-alive connection
+# to www.googleapis.com across calls.
+_thread_local = threading.local()
+
+
+def build_calendar_service() -> Any:
+    """Build one Calendar API Resource (bundled discovery doc, shared credentials) for all tools."""
+    credentials = get_google_credentials()
+
+    def thread_http() -> google_auth_httplib2.AuthorizedHttp:
+        http = getattr(_thread_local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS))
+            _thread_local.http = http
+        return http
+
+    def request_builder(_http, *args, **kwargs) -> HttpRequest:
+        return HttpRequest(thread_http(), *args, **kwargs)
+
+    return build(
+        "calendar",
+        "v3",
+        http=thread_http(),
+        requestBuilder=request_builder,
+        static_discovery=True,
+        cache_discovery=False,
+    )
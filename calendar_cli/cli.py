@@ -1,29 +1,31 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import hashlib
 import os
+import re
+import uuid
+from pathlib import Path
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich import box
 from rich.text import Text
-from dotenv import load_dotenv, set_key, find_dotenv
-from pyfiglet import Figlet, FigletFont
-
-from .agent import build_agent_executor, build_calendar_tools
-from .profile import (
-    write_default_profile_template,
-    load_user_profile,
-    summarize_profile_for_system,
-    get_default_profile_path,
-)
+from dotenv import load_dotenv, find_dotenv
+
+# Heavy dependencies (pyfiglet, langchain, pydantic, yaml) are imported inside the
+# commands that use them so lightweight commands like show-profile start quickly.
+from .files import bulk_set_env, write_text_atomic
 from .system_prompt import (
+    BUILTIN_SYSTEM_INSTRUCTIONS,
     write_default_system_prompt_template,
     load_system_prompt,
 )
@@ -32,12 +34,265 @@ from .system_prompt import (
 app = typer.Typer(help="LangChain + Gemini Google Calendar CLI")
 console = Console()
 
-# Load .env early
-load_dotenv()
+
+@app.callback()
+def init_env():
+    """LangChain + Gemini Google Calendar CLI"""
+    # Load .env before any command runs
+    load_dotenv()
+
+
+BANNER_TEXT = "Time Management\nAgent"
+BANNER_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "calendar_cli"
+
+
+@functools.lru_cache(maxsize=8)
+def render_banner(font: str, text: str = BANNER_TEXT) -> str:
+    """Render each line of text with figlet, cached in-process and on disk.
+
+    The disk cache key includes the pyfiglet version so font updates invalidate it.
+    The cache file is replaced atomically; an empty file is treated as a miss.
+    """
+    import pyfiglet
+
+    key = hashlib.sha1(f"{getattr(pyfiglet, '__version__', '')}|{font}|{text}".encode("utf-8")).hexdigest()[:16]
+    cache_path = BANNER_CACHE_DIR / f"banner_{key}.txt"
+    try:
+        cached = cache_path.read_text(encoding="utf-8")
+        if cached:
+            return cached
+    except (OSError, UnicodeDecodeError):
+        pass
+    fig = pyfiglet.Figlet(font=font)
+    # Render lines as separate blocks to better fit terminal widths
+    banner = "\n".join(fig.renderText(line) for line in text.split("\n"))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(cache_path, banner)
+    except OSError:
+        pass
+    return banner
+
+
+@functools.lru_cache(maxsize=1)
+def available_fonts() -> frozenset:
+    from pyfiglet import FigletFont
+
+    return frozenset(FigletFont.getFonts())
+
+
+LOCAL_DATETIME_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2}) (\d{1,2}):(\d{1,2})$")
+
+
+@functools.lru_cache(maxsize=32)
+def get_zoneinfo(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+def parse_local_datetime(value: str) -> datetime:
+    """Parse 'YYYY-MM-DD HH:MM' (unpadded fields allowed, as with strptime); raises ValueError if invalid."""
+    m = LOCAL_DATETIME_RE.fullmatch(value)
+    if not m:
+        raise ValueError(f"invalid datetime: {value}")
+    return datetime(*map(int, m.groups()))
+
+
+def with_time_context(text: str, tz_name: Optional[str] = None) -> str:
+    """Prefix a user message with the current time (minute precision, local and UTC)."""
+    try:
+        now_local = datetime.now(get_zoneinfo(tz_name)) if tz_name else datetime.now().astimezone()
+    except Exception:
+        now_local = datetime.now().astimezone()
+    now_utc = datetime.now(timezone.utc)
+    return (
+        f"[Zaman] yerel: {now_local.strftime('%Y-%m-%d %H:%M %Z%z')} | "
+        f"UTC: {now_utc.strftime('%Y-%m-%d %H:%M %Z%z')}\n\n{text}"
+    )
+
+
+def message_text(message) -> str:
+    """Plain text of a LangChain message or chunk (Gemini may return a list of content parts)."""
+    content = getattr(message, "content", None)
+    if isinstance(content, list):
+        return "".join(p.get("text", "") if isinstance(p, dict) else str(p) for p in content)
+    return content if isinstance(content, str) else ""
+
+
+async def run_agent_turn(agent, messages: List, config: Optional[dict] = None) -> Optional[List]:
+    """Stream one agent turn asynchronously; independent tool calls run concurrently.
+
+    With a checkpointer, messages holds only what is new since the previous turn.
+    Tokens and tool results are appended to one Text buffer inside a Live panel, so the
+    terminal redraws at most refresh_per_second times instead of once per event.
+    """
+    last_messages: Optional[List] = None
+    buffer = Text()
+    with Live(Panel.fit(buffer), console=console, refresh_per_second=8):
+        async for mode, data in agent.astream({"messages": messages}, config, stream_mode=["messages", "values"]):
+            if mode == "values":
+                last_messages = data["messages"]
+                continue
+            chunk, _metadata = data
+            text = message_text(chunk)
+            if not text:
+                continue
+            if getattr(chunk, "type", None) == "tool":
+                buffer.append(f"\n[{getattr(chunk, 'name', 'tool')}] {text}\n", style="dim")
+            else:
+                buffer.append(text)
+        if not buffer and last_messages:
+            buffer.append(message_text(last_messages[-1]) or str(last_messages[-1]))
+    return last_messages
+
+
+NEXT_EVENT_PROMPT = "Sıradaki takvim etkinliğim ne?"
+# Patterns are written case-folded (see cache.fold_text): "sıradaki" -> "siradaki"
+NEXT_EVENT_RE = re.compile(r"(siradaki|bir sonraki|yaklaşan|next|upcoming).*(etkinlik|toplanti|event|meeting)")
+# Phrasings that ask exactly what NEXT_EVENT_PROMPT asks; anything else goes to the agent
+NEXT_EVENT_QUESTIONS = (
+    NEXT_EVENT_PROMPT,
+    "Sıradaki etkinliğim ne?",
+    "Sıradaki toplantım ne?",
+    "Sıradaki toplantım ne zaman?",
+    "Bir sonraki etkinliğim ne?",
+    "Bir sonraki toplantım ne?",
+    "Bir sonraki toplantım ne zaman?",
+    "What is my next event?",
+    "What's my next event?",
+    "What is my next meeting?",
+    "What's my next meeting?",
+    "When is my next meeting?",
+    "When is my next event?",
+    "Next event?",
+    "Next meeting?",
+)
+
+
+def question_key(text: str) -> str:
+    """Normalize a question for exact matching: folded case, no punctuation, single spaces."""
+    from .cache import fold_text
+
+    return " ".join(re.sub(r"[^\w\s]", "", fold_text(text)).split())
+
+
+@functools.lru_cache(maxsize=1)
+def next_event_question_keys() -> frozenset:
+    return frozenset(question_key(q) for q in NEXT_EVENT_QUESTIONS)
+
+
+async def prefetch_next_event(agent, system_instructions: str, tz_name: Optional[str] = None) -> Optional[str]:
+    """Answer NEXT_EVENT_PROMPT on a throwaway thread while the user is still typing.
+
+    The thread is removed from the agent's checkpointer afterwards (also when cancelled).
+    """
+    thread_id = f"cli-prefetch-{uuid.uuid4().hex}"
+    config = {"configurable": {"thread_id": thread_id}}
+    messages = [("system", system_instructions), ("user", with_time_context(NEXT_EVENT_PROMPT, tz_name))]
+    try:
+        state = await agent.ainvoke({"messages": messages}, config)
+    finally:
+        if agent.checkpointer is not None:
+            agent.checkpointer.delete_thread(thread_id)
+    return message_text(state["messages"][-1]) or None
+
+
+async def take_prefetched_answer(prefetch: Optional[asyncio.Task], user_input: str) -> Tuple[Optional[str], bool]:
+    """Return (prefetched answer or None, whether it answers user_input as is).
+
+    The answer replaces the agent turn only when user_input is one of NEXT_EVENT_QUESTIONS.
+    For other questions about the next event a finished prefetch is returned as context
+    for the agent ("cancel my next meeting", "who attends my next meeting?"); otherwise
+    the prefetch is cancelled.
+    """
+    from .cache import fold_text
+
+    if prefetch is None:
+        return None, False
+    if question_key(user_input) in next_event_question_keys():
+        try:
+            return await prefetch, True
+        except Exception:
+            return None, False
+    if not prefetch.done():
+        prefetch.cancel()
+        return None, False
+    if prefetch.cancelled() or prefetch.exception() is not None:
+        return None, False
+    related = NEXT_EVENT_RE.search(fold_text(user_input)) is not None
+    return (prefetch.result() if related else None), False
+
+
+def with_prefetched_context(text: str, answer: Optional[str]) -> str:
+    """Prefix a user message with the prefetched next-event answer, if any."""
+    if not answer:
+        return text
+    return f"[Sıradaki etkinlik] {answer}\n\n{text}"
+
+
+async def chat_loop(
+    agent, system_instructions: str, prompt: str, tz_name: Optional[str] = None, cache=None
+) -> None:
+    """Run the REPL on a single event loop so async model/tool clients are reused across turns.
+
+    History lives in the agent's checkpointer under one thread_id; each turn sends only
+    the messages not yet in that state (the system message on the first turn).
+    """
+    from prompt_toolkit import PromptSession
+
+    from .cache import context_key, is_read_only_turn
+    from .settings import get_settings
+
+    session = PromptSession()
+    speculative = get_settings().calendar_cli_speculative_prefetch
+    config = {"configurable": {"thread_id": f"cli-session-{uuid.uuid4().hex}"}}
+    pending: List = [("system", system_instructions)]
+    prefetch: Optional[asyncio.Task] = None
+    # Cache entries only match prompts asked right after the same answer
+    context = ""
+    user_input = prompt
+    while True:
+        prefetched, exact = await take_prefetched_answer(prefetch, user_input)
+        prefetched_context = None
+        if not exact:
+            prefetched_context, prefetched = prefetched, None
+        cached, embedding = (None, None)
+        if prefetched is None and cache:
+            cached, embedding = cache.lookup(user_input, context)
+        reused = prefetched or cached
+        if reused is not None:
+            console.print(Panel.fit(reused, title="Prefetched answer" if prefetched else "Cached answer", border_style="dim"))
+            # Sent along with the next agent turn so the agent still sees the exchange
+            pending.extend([("user", with_time_context(user_input, tz_name)), ("assistant", reused)])
+            context = context_key(reused)
+        else:
+            pending.append(("user", with_time_context(with_prefetched_context(user_input, prefetched_context), tz_name)))
+            last_messages = await run_agent_turn(agent, pending, config)
+            pending = []
+            if last_messages is not None:
+                answer = message_text(last_messages[-1])
+                # Turns that created/changed events are never replayed
+                if cache and answer and is_read_only_turn(last_messages):
+                    cache.store(user_input, answer, embedding, context)
+                context = context_key(answer)
+
+        # Overlap the user's typing with a likely follow-up question (opt-in; costs a model call)
+        prefetch = asyncio.create_task(prefetch_next_event(agent, system_instructions, tz_name)) if speculative else None
+        try:
+            user_input = ""
+            while not user_input:
+                user_input = (await session.prompt_async("You (type 'exit' to quit): ")).strip()
+        except (EOFError, KeyboardInterrupt):
+            user_input = "exit"
+        if user_input.lower() in {"exit", "quit", "q"}:
+            if prefetch is not None:
+                prefetch.cancel()
+            break
 
 
 def require_google_api_key():
-    if not os.getenv("GOOGLE_API_KEY"):
+    from .settings import get_settings
+
+    if not get_settings().google_api_key:
         console.print("[bold red]GOOGLE_API_KEY not set.[/bold red]")
         console.print("Set it in your environment or in a .env file.")
         raise typer.Exit(1)
@@ -46,18 +301,21 @@ def require_google_api_key():
 @app.command(name="env-info")
 def env_info():
     """Show environment variables used by the CLI."""
+    from .settings import get_settings
+
+    settings = get_settings()
     table = Table(title="Environment", box=box.SIMPLE_HEAVY)
     table.add_column("Key", style="cyan", no_wrap=True)
     table.add_column("Value", style="green")
-    table.add_row("GOOGLE_API_KEY", "SET" if os.getenv("GOOGLE_API_KEY") else "-")
-    table.add_row("GEMINI_MODEL", os.getenv("GEMINI_MODEL", "gemini-2.5-flash"))
-    table.add_row("LANGSMITH_TRACING", os.getenv("LANGSMITH_TRACING", "-"))
-    table.add_row("LANGSMITH_ENDPOINT", os.getenv("LANGSMITH_ENDPOINT", "-"))
-    table.add_row("LANGSMITH_PROJECT", os.getenv("LANGSMITH_PROJECT", "-"))
-    table.add_row("LANGSMITH_API_KEY", "SET" if os.getenv("LANGSMITH_API_KEY") else "-")
-    table.add_row("CLI_BANNER_COLOR", os.getenv("CLI_BANNER_COLOR", "bright_blue"))
-    table.add_row("CLI_FIGLET_FONT", os.getenv("CLI_FIGLET_FONT", "standard"))
-    table.add_row("CLI_DEFAULT_TIMEZONE", os.getenv("CLI_DEFAULT_TIMEZONE", "Etc/UTC"))
+    table.add_row("GOOGLE_API_KEY", "SET" if settings.google_api_key else "-")
+    table.add_row("GEMINI_MODEL", settings.gemini_model)
+    table.add_row("LANGSMITH_TRACING", settings.langsmith_tracing or "-")
+    table.add_row("LANGSMITH_ENDPOINT", settings.langsmith_endpoint or "-")
+    table.add_row("LANGSMITH_PROJECT", settings.langsmith_project or "-")
+    table.add_row("LANGSMITH_API_KEY", "SET" if settings.langsmith_api_key else "-")
+    table.add_row("CLI_BANNER_COLOR", settings.cli_banner_color)
+    table.add_row("CLI_FIGLET_FONT", settings.cli_figlet_font)
+    table.add_row("CLI_DEFAULT_TIMEZONE", settings.cli_default_timezone)
     console.print(table)
 
 
@@ -65,6 +323,8 @@ def env_info():
 def tools():
     """List available Google Calendar tools."""
     require_google_api_key()
+    from .agent import build_calendar_tools
+
     toolkit_tools = build_calendar_tools()
     table = Table(title="Calendar Tools", box=box.ROUNDED)
     table.add_column("#")
@@ -78,13 +338,14 @@ def tools():
 def ask(prompt: Optional[str] = typer.Argument(None, help="Start the conversation with this message")):
     """Chat with the agent to execute calendar actions."""
     require_google_api_key()
+    from .agent import build_agent_executor, build_semantic_cache
+    from .profile import load_user_profile, summarize_profile_for_system
+    from .settings import get_settings
 
     # Fancy banner similar to ASCII art intro
     try:
-        banner_color = os.getenv("CLI_BANNER_COLOR", "bright_blue")
-        fig = Figlet(font=os.getenv("CLI_FIGLET_FONT", "standard"))
-        # Split into two blocks to better fit terminal widths
-        banner = fig.renderText("Time Management") + "\n" + fig.renderText("Agent")
+        banner_color = get_settings().cli_banner_color
+        banner = render_banner(get_settings().cli_figlet_font)
         renderable = Text(banner, style=f"bold {banner_color}")
         console.print(Panel.fit(renderable, title=f"[bold {banner_color}]Welcome", border_style=banner_color))
     except Exception:
@@ -94,76 +355,43 @@ def ask(prompt: Optional[str] = typer.Argument(None, help="Start the conversatio
     if not prompt:
         prompt = Prompt.ask("You", default="Create a green event for tomorrow 10:00-10:30 named Standup")
 
-    # Build a system prompt that sets role, current datetime context, and optional user profile
+    # Build a static system prompt (role, rules, timezone name, optional user profile).
+    # The wall clock is sent with each user turn instead, so the system prefix stays
+    # byte-identical across turns and Gemini's implicit prompt cache can hit.
     # Prefer profile timezone if provided for display/context
     profile_tz_name = None
     user_profile = load_user_profile()
     if user_profile:
         profile_tz_name = user_profile.timezone or None
-    try:
-        now_local = (
-            datetime.now(ZoneInfo(profile_tz_name)) if profile_tz_name else datetime.now().astimezone()
-        )
-    except Exception:
-        now_local = datetime.now().astimezone()
-    now_utc = datetime.now(timezone.utc)
+    tz_label = profile_tz_name or datetime.now().astimezone().tzname()
 
     profile_note = ""
     if user_profile:
-        profile_note = "\n\n" + summarize_profile_for_system(user_profile)
+        profile_note = "\n\n" + (user_profile.system_summary or summarize_profile_for_system(user_profile))
     # Prefer external system prompt if present
     external_prompt = load_system_prompt()
-    system_instructions = (
-        "Rol: Sen, insan biyolojisi, sirkadiyen ritim, nörobilim, ergonomi ve üretkenlik konularında uzman "
-        "bir Zaman Yönetimi Danışmanı ve takvim ajanısın. Amaç: Kullanıcının talebini en kısa ve net şekilde "
-        "yanıtlamak ve gerektiğinde takvim üzerinde güvenli işlemler yapmak (oluştur/ara/güncelle/taşı/sil). "
-        "Çakışmaları ve kısıtları kontrol et; izinsiz/yıkıcı değişiklik yapma.\n\n"
-        "Varsayılan iletişim tarzı: Soruyu doğrudan yanıtla; gereksiz tavsiye ve uzun açıklamalardan kaçın. "
-        "Yanıt sonunda yalnızca şu soruyu sor: 'Öneri ve kısa bilimsel açıklama eklememi ister misiniz? (E/H)'. "
-        "Kullanıcı 'E' derse kısaca öneriler + kısa gerekçe ekle; 'H' derse ekleme.\n\n"
-        "Planlama ilkeleri (iç kurallar):\n"
-        "- Biyolojik saat: 09:00–11:00 ve 16:00–18:00 zihinsel zirve; ~14:00 ve geç saatlerde odak azalır.\n"
-        "- Zaman yönetiminin 3 boyutu: Planlama (önemli işleri zirve saatlere koy), Tutum (zaman sınırlı; erteleme), "
-        "Tuzaklar (gereksiz toplantı/habersiz ziyaret/sosyal medya; gerektiğinde 'hayır' de).\n"
-        "- Mola ve sağlık: 20-20-20 göz kuralı; 60–90 dk’da bir 5–10 dk aktif mola; postür değişikliği/esneme.\n"
-        "- Süreç: Günlük zaman kütüğü ile analiz → önem–aciliyet matrisi → uygula → gün sonunda sapmaları değerlendir.\n"
-        "- Görev yerleşimi: Yüksek odak işler zirvede; rutin işler düşük enerji saatlerinde; yaratıcı işler sabah erken "
-        "veya akşam sakin saatlerde (kişisel ritme bağlı).\n"
-        "- Boş zaman verilirse uygun görevlerle doldur; verilmezse alternatif zaman pencereleri sun.\n\n"
-        "Çıktı davranışı: Kullanıcı açıkça 'günlük plan' isterse 'Saat Bazlı Görev Planı'nı üret. "
-        "Mola/Egzersiz, Göz/Postür, Zorluk Sırası, Bilimsel Açıklama bölümlerini yalnızca kullanıcı 'E' yanıtını verdikten sonra ekle.\n\n"
-        f"Şu anki tarih-saat (yerel): {now_local.strftime('%Y-%m-%d %H:%M:%S %Z%z')}\n"
-        f"Şu anki tarih-saat (UTC):   {now_utc.strftime('%Y-%m-%d %H:%M:%S %Z%z')}"
-        f"{profile_note}"
-    )
+    system_instructions = f"{BUILTIN_SYSTEM_INSTRUCTIONS}Zaman dilimi: {tz_label}{profile_note}"
     if external_prompt:
-        # If user provided an external prompt, prepend it and keep dynamic context below
+        # If user provided an external prompt, prepend it and keep built-in context below
         system_instructions = external_prompt.strip() + "\n\n" + system_instructions
 
     console.rule("Agent")
     # Maintain conversation until user types exit/quit/q
-    messages: List = [("system", system_instructions), ("user", prompt)]
-    while True:
-        last_messages: Optional[List] = None
-        events = agent.stream({"messages": messages}, stream_mode="values")
-        for event in events:
-            message = event["messages"][-1]
-            last_messages = event["messages"]
-            try:
-                content = getattr(message, "content", None) or str(message)
-                console.print(Panel.fit(str(content)))
-            except Exception:
-                console.print(str(message))
-
-        if last_messages is not None:
-            messages = last_messages
-
-        user_input = Prompt.ask("You (type 'exit' to quit)", default="").strip()
-        if user_input.lower() in {"exit", "quit", "q"}:
-            break
-        if not user_input:
-            continue
-        messages.append(("user", user_input))
+    asyncio.run(chat_loop(agent, system_instructions, prompt, profile_tz_name, build_semantic_cache()))
+
+
+def resolve_timezone(timezone: Optional[str] = None) -> str:
+    """Choose timezone: CLI arg > profile > env > default."""
+    from .profile import load_user_profile
+    from .settings import get_settings
+
+    pf = load_user_profile()
+    chosen_tz = timezone or (pf.timezone if pf else None) or get_settings().cli_default_timezone
+    # Normalize timezone (avoid libraries that fail on plain 'UTC')
+    tz = chosen_tz.strip() if isinstance(chosen_tz, str) else "Etc/UTC"
+    if tz.upper() == "UTC":
+        tz = "Etc/UTC"
+    return tz
 
 
 @app.command(name="quick-create")
@@ -180,21 +408,17 @@ def quick_create(
     require_google_api_key()
     from langchain_google_community.calendar.create_event import CalendarCreateEvent
 
+    from .agent import get_calendar_tool
+
     # Validate datetime format early
     for dt in (start, end):
         try:
-            datetime.strptime(dt, "%Y-%m-%d %H:%M")
+            parse_local_datetime(dt)
         except ValueError:
             console.print(f"[red]Invalid datetime format:[/red] {dt} (expected YYYY-MM-DD HH:MM)")
             raise typer.Exit(1)
 
-    # Choose timezone: CLI arg > profile > env > default
-    pf = load_user_profile()
-    chosen_tz = timezone or (pf.timezone if pf else None) or os.getenv("CLI_DEFAULT_TIMEZONE", "Etc/UTC")
-    # Normalize timezone (avoid libraries that fail on plain 'UTC')
-    tz = chosen_tz.strip() if isinstance(chosen_tz, str) else "Etc/UTC"
-    if tz.upper() == "UTC":
-        tz = "Etc/UTC"
+    tz = resolve_timezone(timezone)
 
     payload = {
         "summary": summary,
@@ -209,25 +433,85 @@ def quick_create(
     if color_id:
         payload["color_id"] = color_id
 
-    tool = CalendarCreateEvent()
+    tool = get_calendar_tool(CalendarCreateEvent)
     result = tool.invoke(payload)
     console.print(Panel.fit(str(result), title="Create Event", border_style="green"))
 
 
+@app.command(name="bulk-create")
+def bulk_create(
+    path: Path = typer.Argument(..., exists=True, dir_okay=False, help="CSV, JSONL or text file (one event per row)"),
+    timezone: Optional[str] = typer.Option(None, help="Default IANA timezone for rows without one"),
+    max_wait: float = typer.Option(3600.0, help="Seconds to wait for the Gemini batch job"),
+    dry_run: bool = typer.Option(False, help="Only show the parsed events; do not create them"),
+):
+    """Normalize many events with one Gemini Batch API job, then create them in one Calendar batch."""
+    require_google_api_key()
+    import csv
+
+    from .agent import get_calendar_tool
+    from .batch_tools import CalendarBatchCreateEvents
+    from .bulk import build_batch_requests, parse_batch_events, read_event_rows, run_gemini_batch
+    from .settings import get_settings
+
+    try:
+        rows = read_event_rows(path)
+    except (OSError, ValueError, csv.Error) as e:
+        console.print(f"[red]Could not read events:[/red] {e}")
+        raise typer.Exit(1)
+    if not rows:
+        console.print(f"[yellow]No events found in[/yellow] {path}")
+        return
+    tz = resolve_timezone(timezone)
+    requests = build_batch_requests(rows, tz)
+    try:
+        with console.status(f"Waiting for Gemini batch ({len(rows)} events)..."):
+            job = run_gemini_batch(requests, get_settings().gemini_model, max_wait=max_wait)
+    except Exception as e:
+        console.print(f"[red]Batch failed:[/red] {e}")
+        raise typer.Exit(1)
+    events, errors = parse_batch_events(job, rows, tz)
+
+    table = Table(title="Parsed events", box=box.SIMPLE_HEAVY)
+    table.add_column("Summary", style="bold")
+    table.add_column("Start", style="cyan")
+    table.add_column("End", style="cyan")
+    table.add_column("Timezone")
+    for event in events:
+        table.add_row(event.summary, event.start_datetime, event.end_datetime, event.timezone)
+    console.print(table)
+    for row, error in errors:
+        console.print(f"[red]Skipped:[/red] {row} ({error})")
+    if dry_run or not events:
+        return
+
+    tool = get_calendar_tool(CalendarBatchCreateEvents)
+    result = tool.invoke({"events": [event.model_dump() for event in events]})
+    console.print(Panel.fit(str(result), title="Bulk Create", border_style="green"))
+
+
 @app.command(name="list-calendars")
 def list_calendars():
     """List calendars via toolkit tool."""
     require_google_api_key()
+    import orjson
     from langchain_google_community.calendar.get_calendars_info import (
         GetCalendarsInfo,
     )
 
-    tool = GetCalendarsInfo()
+    from .agent import get_calendar_tool
+
+    tool = get_calendar_tool(GetCalendarsInfo)
     out = tool.invoke({})
     try:
-        data = json.loads(out) if isinstance(out, str) else out
+        data = orjson.loads(out) if isinstance(out, (str, bytes)) else out
     except Exception:
-        data = out
+        import json
+
+        try:
+            data = json.loads(out) if isinstance(out, str) else out
+        except Exception:
+            data = out
 
     table = Table(title="Calendars", box=box.SIMPLE_HEAVY)
     table.add_column("Summary", style="bold")
@@ -246,36 +530,46 @@ def configure_langsmith(
     endpoint: str = typer.Option("https://api.smith.langchain.com", help="LangSmith API endpoint"),
     api_key: Optional[str] = typer.Option(None, prompt="LangSmith API Key", hide_input=True),
     project: Optional[str] = typer.Option(None, prompt="LangSmith Project Name"),
+    quiet: bool = typer.Option(False, "--quiet", help="Print a single summary line instead of a table"),
 ):
     """Persist LangSmith settings into .env so you don't need to export them each time."""
+    from .settings import reload_settings
+
     env_path = find_dotenv(usecwd=True)
     if not env_path:
         env_path = ".env"
 
-    set_key(env_path, "LANGSMITH_TRACING", "true" if tracing else "false")
+    updates = {"LANGSMITH_TRACING": "true" if tracing else "false"}
     if endpoint:
-        set_key(env_path, "LANGSMITH_ENDPOINT", endpoint)
+        updates["LANGSMITH_ENDPOINT"] = endpoint
     if api_key:
-        set_key(env_path, "LANGSMITH_API_KEY", api_key)
+        updates["LANGSMITH_API_KEY"] = api_key
     if project:
-        set_key(env_path, "LANGSMITH_PROJECT", project)
+        updates["LANGSMITH_PROJECT"] = project
+    bulk_set_env(env_path, updates)
 
     # Reload .env for this process
     load_dotenv(override=True)
+    settings = reload_settings()
 
+    if quiet:
+        console.print(f"Saved to {env_path}: LANGSMITH_TRACING={settings.langsmith_tracing or '-'}, LANGSMITH_PROJECT={settings.langsmith_project or '-'}")
+        return
     table = Table(title="LangSmith configured", box=box.ROUNDED)
     table.add_column("Key", style="cyan", no_wrap=True)
     table.add_column("Value", style="green")
-    table.add_row("LANGSMITH_TRACING", os.getenv("LANGSMITH_TRACING", "-"))
-    table.add_row("LANGSMITH_ENDPOINT", os.getenv("LANGSMITH_ENDPOINT", "-"))
-    table.add_row("LANGSMITH_PROJECT", os.getenv("LANGSMITH_PROJECT", "-"))
-    table.add_row("LANGSMITH_API_KEY", "SET" if os.getenv("LANGSMITH_API_KEY") else "-")
+    table.add_row("LANGSMITH_TRACING", settings.langsmith_tracing or "-")
+    table.add_row("LANGSMITH_ENDPOINT", settings.langsmith_endpoint or "-")
+    table.add_row("LANGSMITH_PROJECT", settings.langsmith_project or "-")
+    table.add_row("LANGSMITH_API_KEY", "SET" if settings.langsmith_api_key else "-")
     console.print(Panel.fit(table, title="Saved to .env"))
 
 
 @app.command(name="init-profile")
 def init_profile(path: Optional[str] = typer.Option(None, help="Custom profile path (YAML)")):
     """Create a starter user_profile.yaml if it doesn't exist."""
+    from .profile import write_default_profile_template
+
     target = write_default_profile_template(path)
     console.print(Panel.fit(f"Profile ready: {target}", border_style="cyan"))
 
@@ -283,11 +577,13 @@ def init_profile(path: Optional[str] = typer.Option(None, help="Custom profile p
 @app.command(name="show-profile")
 def show_profile(path: Optional[str] = typer.Option(None, help="Profile path (YAML)")):
     """Show the current user profile that the agent will use, if any."""
+    from .profile import load_user_profile, summarize_profile_for_system
+
     pf = load_user_profile(path)
     if not pf:
         console.print("No profile found. Run: python -m calendar_cli.cli init-profile")
         return
-    summary = summarize_profile_for_system(pf)
+    summary = pf.system_summary or summarize_profile_for_system(pf)
     console.print(Panel.fit(summary, title="User Profile", border_style="magenta"))
 
 
@@ -302,24 +598,34 @@ def init_system_prompt(path: Optional[str] = typer.Option(None, help="Custom sys
 def configure_google(
     api_key: Optional[str] = typer.Option(None, prompt="Google API Key", hide_input=True),
     model: str = typer.Option("gemini-2.5-flash", help="Gemini model name"),
+    quiet: bool = typer.Option(False, "--quiet", help="Print a single summary line instead of a table"),
 ):
     """Persist Google API settings into .env (GOOGLE_API_KEY, GEMINI_MODEL)."""
+    from .settings import reload_settings
+
     env_path = find_dotenv(usecwd=True)
     if not env_path:
         env_path = ".env"
 
+    updates = {}
     if api_key:
-        set_key(env_path, "GOOGLE_API_KEY", api_key)
+        updates["GOOGLE_API_KEY"] = api_key
     if model:
-        set_key(env_path, "GEMINI_MODEL", model)
+        updates["GEMINI_MODEL"] = model
+    if updates:
+        bulk_set_env(env_path, updates)
 
     load_dotenv(override=True)
+    settings = reload_settings()
 
+    if quiet:
+        console.print(f"Saved to {env_path}: GOOGLE_API_KEY={'SET' if settings.google_api_key else '-'}, GEMINI_MODEL={settings.gemini_model}")
+        return
     table = Table(title="Google config saved", box=box.ROUNDED)
     table.add_column("Key", style="cyan", no_wrap=True)
     table.add_column("Value", style="green")
-    table.add_row("GOOGLE_API_KEY", "SET" if os.getenv("GOOGLE_API_KEY") else "-")
-    table.add_row("GEMINI_MODEL", os.getenv("GEMINI_MODEL", "-"))
+    table.add_row("GOOGLE_API_KEY", "SET" if settings.google_api_key else "-")
+    table.add_row("GEMINI_MODEL", settings.gemini_model)
     console.print(Panel.fit(table, title="Saved to .env"))
 
 
@@ -330,11 +636,10 @@ def preview_banner(
 ):
     """Preview banner with given font and color (no changes saved)."""
     try:
-        if font not in FigletFont.getFonts():
+        if font not in available_fonts():
             console.print(f"[red]Unknown font:[/red] {font}")
             return
-        fig = Figlet(font=font)
-        banner = fig.renderText("Time Management") + "\n" + fig.renderText("Agent")
+        banner = render_banner(font)
         console.print(Panel.fit(Text(banner, style=f"bold {color}"), title=f"[bold {color}]Preview", border_style=color))
     except Exception as e:
         console.print(f"[red]Preview failed:[/red] {e}")
@@ -346,13 +651,19 @@ def configure_banner(
     color: Optional[str] = typer.Option(None, help="rich color (e.g., bright_blue, cyan, magenta)"),
 ):
     """Persist banner font/color into .env. Great choices: isometric1, isometric2, 3-d, banner3-D, slant."""
+    from .settings import reload_settings
+
     env_path = find_dotenv(usecwd=True) or ".env"
+    updates = {}
     if font:
-        set_key(env_path, "CLI_FIGLET_FONT", font)
+        updates["CLI_FIGLET_FONT"] = font
     if color:
-        set_key(env_path, "CLI_BANNER_COLOR", color)
+        updates["CLI_BANNER_COLOR"] = color
+    if updates:
+        bulk_set_env(env_path, updates)
     load_dotenv(override=True)
-    console.print(Panel.fit(f"Banner updated: font={os.getenv('CLI_FIGLET_FONT')}, color={os.getenv('CLI_BANNER_COLOR')}", border_style=os.getenv("CLI_BANNER_COLOR", "bright_blue")))
+    settings = reload_settings()
+    console.print(Panel.fit(f"Banner updated: font={settings.cli_figlet_font}, color={settings.cli_banner_color}", border_style=settings.cli_banner_color))
 
 
 def main():
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write text to a temp file in the same directory and os.replace it over path.
+
+    Readers see either the old or the new contents, never a truncated file.
+    The existing file's permissions are kept (mkstemp would create it 0600).
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.resolve().parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        if path.exists():
+            os.chmod(tmp_path, path.stat().st_mode & 0o777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _quote_env_value(value: str) -> str:
+    # Same escaping as dotenv.set_key's "always" quote mode; backslashes first
+    return "'{}'".format(value.replace("\\", "\\\\").replace("'", "\\'"))
+
+
+def bulk_set_env(env_path: str, updates: Dict[str, str]) -> None:
+    """Set several keys in a .env file with one read and one write.
+
+    The file is split with python-dotenv's own parser, so multi-line values, comments and
+    unparsable lines are kept byte for byte; only bindings of the updated keys are rewritten
+    (keeping an 'export ' prefix). Values are single-quoted like dotenv.set_key's default.
+    """
+    from dotenv.parser import parse_stream
+
+    path = Path(env_path)
+    try:
+        source = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        source = ""
+    quoted = {key: _quote_env_value(value) for key, value in updates.items()}
+    out: List[str] = []
+    seen = set()
+    for binding in parse_stream(io.StringIO(source)):
+        original = binding.original.string
+        if binding.key not in quoted:
+            out.append(original)
+            continue
+        # The parser attaches preceding blank lines to the binding; keep them
+        body = original.lstrip()
+        leading = original[: len(original) - len(body)]
+        prefix = "export " if body.startswith("export ") else ""
+        out.append(f"{leading}{prefix}{binding.key}={quoted[binding.key]}\n")
+        seen.add(binding.key)
+    if out and not out[-1].endswith("\n"):
+        out.append("\n")
+    out.extend(f"{key}={value}\n" for key, value in quoted.items() if key not in seen)
+    write_text_atomic(path, "".join(out))
@@ -1,39 +1,78 @@
 from __future__ import annotations
 
+import functools
 import os
-from typing import Dict, List, Optional
-
-import yaml
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field, fields, replace
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 
 DEFAULT_PROFILE_ENV_KEY = "CALENDAR_CLI_PROFILE"
 DEFAULT_PROFILE_PATH = "user_profile.yaml"
+PROFILE_CACHE_SUFFIX = ".cache.json"
+# Set to 1 to validate the YAML with the pydantic schema (slower, reports type errors as a miss)
+STRICT_PROFILE_ENV_KEY = "CALENDAR_CLI_STRICT"
+
+# Paths known to be missing in this process; cleared when a template is written
+_PROFILE_NEGATIVE: set[str] = set()
+
+
+@dataclass(slots=True, frozen=True)
+class UserProfile:
+    """Read-only profile used on the hot path; see profile_schema.UserProfileSchema for field docs."""
+
+    timezone: Optional[str] = None
+    workdays: Tuple[str, ...] = ()
+    working_hours: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    lunch: Optional[str] = None
+    no_meetings: Tuple[str, ...] = ()
+    preferred_deep_work: Tuple[str, ...] = ()
+    avoid_times: Tuple[str, ...] = ()
+    notes: Optional[str] = None
+    # Derived at load time by summarize_profile_for_system; not read from YAML
+    system_summary: Optional[str] = None
+
 
+_PROFILE_FIELDS = tuple(f.name for f in fields(UserProfile))
 
-class UserProfile(BaseModel):
-    timezone: Optional[str] = Field(
-        default=None, description="IANA timezone, e.g., Europe/Istanbul"
-    )
-    workdays: Optional[List[str]] = Field(
-        default=None, description="List of active work days, e.g., ['mon','tue','wed','thu','fri']"
-    )
-    working_hours: Optional[Dict[str, str]] = Field(
-        default=None, description="Per-day working window, e.g., {'mon': '09:00-18:00'}"
-    )
-    lunch: Optional[str] = Field(
-        default=None, description="Lunch break window, e.g., '12:30-13:30'"
-    )
-    no_meetings: Optional[List[str]] = Field(
-        default=None, description="List of time windows to avoid meetings, e.g., ['Fri 14:00-16:00']"
-    )
-    preferred_deep_work: Optional[List[str]] = Field(
-        default=None, description="Preferred deep work windows, e.g., ['09:00-11:00','16:00-18:00']"
-    )
-    avoid_times: Optional[List[str]] = Field(
-        default=None, description="General avoid windows, e.g., ['18:00-21:00']"
-    )
-    notes: Optional[str] = Field(default=None, description="Free-form notes")
+
+_TUPLE_FIELDS = frozenset({"workdays", "no_meetings", "preferred_deep_work", "avoid_times"})
+
+
+def profile_from_dict(data: Any) -> Optional[UserProfile]:
+    """Build a UserProfile from parsed YAML/JSON, ignoring unknown keys and nulls.
+
+    Returns None if a field has the wrong shape (same outcome as a pydantic validation error).
+    """
+    if not isinstance(data, Mapping):
+        return None
+    kwargs: Dict[str, Any] = {}
+    for name in _PROFILE_FIELDS:
+        value = data.get(name)
+        if value is None:
+            continue
+        if name in _TUPLE_FIELDS:
+            if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                return None
+            value = tuple(value)
+        elif name == "working_hours":
+            if not isinstance(value, dict) or not all(
+                isinstance(k, str) and isinstance(v, str) for k, v in value.items()
+            ):
+                return None
+            value = MappingProxyType(dict(value))
+        elif not isinstance(value, str):
+            return None
+        kwargs[name] = value
+    return UserProfile(**kwargs)
+
+
+def profile_to_dict(profile: UserProfile) -> Dict[str, Any]:
+    data: Dict[str, Any] = {}
+    for name in _PROFILE_FIELDS:
+        value = getattr(profile, name)
+        data[name] = dict(value) if isinstance(value, Mapping) else value
+    return data
 
 
 PROFILE_TEMPLATE = """
@@ -69,20 +108,69 @@ def write_default_profile_template(path: Optional[str] = None) -> str:
         return target_path
     with open(target_path, "w", encoding="utf-8") as f:
         f.write(PROFILE_TEMPLATE.strip() + "\n")
+    _PROFILE_NEGATIVE.discard(target_path)
     return target_path
 
 
 def load_user_profile(path: Optional[str] = None) -> Optional[UserProfile]:
     """Load user profile from YAML if present; return None if missing or invalid."""
     target_path = path or get_default_profile_path()
-    if not os.path.exists(target_path):
+    if target_path in _PROFILE_NEGATIVE:
         return None
     try:
+        mtime_ns = os.stat(target_path).st_mtime_ns
+    except OSError:
+        _PROFILE_NEGATIVE.add(target_path)
+        return None
+    strict = os.getenv(STRICT_PROFILE_ENV_KEY) == "1"
+    return _load_user_profile_cached(target_path, mtime_ns, strict)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_user_profile_cached(target_path: str, mtime_ns: int, strict: bool = False) -> Optional[UserProfile]:
+    """Parse the profile, preferring a JSON cache next to the YAML that is at least as new.
+
+    Strict mode always re-validates the YAML, since the cache may come from a non-strict run.
+    """
+    import orjson
+
+    cache_path = target_path + PROFILE_CACHE_SUFFIX
+    try:
+        if not strict and os.stat(cache_path).st_mtime_ns >= mtime_ns:
+            with open(cache_path, "rb") as f:
+                profile = profile_from_dict(orjson.loads(f.read()))
+            if profile is None:
+                raise ValueError("invalid profile cache")
+            if profile.system_summary is None:
+                profile = replace(profile, system_summary=summarize_profile_for_system(profile))
+            return profile
+    except Exception:
+        pass
+    try:
+        import yaml
+
         with open(target_path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f) or {}
-        return UserProfile.model_validate(data)
+        if strict:
+            from .profile_schema import UserProfileSchema
+
+            data = UserProfileSchema.model_validate(data).model_dump()
+        if isinstance(data, dict):
+            data.pop("system_summary", None)
+        profile = profile_from_dict(data)
     except Exception:
         return None
+    if profile is None:
+        return None
+    profile = replace(profile, system_summary=summarize_profile_for_system(profile))
+    try:
+        # Serialize first so a failure cannot leave a truncated cache file behind
+        payload = orjson.dumps(profile_to_dict(profile))
+        with open(cache_path, "wb") as f:
+            f.write(payload)
+    except (OSError, TypeError, ValueError):
+        pass
+    return profile
 
 
 def summarize_profile_for_system(profile: UserProfile) -> str:
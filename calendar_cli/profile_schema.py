@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class UserProfileSchema(BaseModel):
+    """Strict pydantic validation for user_profile.yaml (enabled with CALENDAR_CLI_STRICT=1)."""
+
+    timezone: Optional[str] = Field(
+        default=None, description="IANA timezone, e.g., Europe/Istanbul"
+    )
+    workdays: Optional[List[str]] = Field(
+        default=None, description="List of active work days, e.g., ['mon','tue','wed','thu','fri']"
+    )
+    working_hours: Optional[Dict[str, str]] = Field(
+        default=None, description="Per-day working window, e.g., {'mon': '09:00-18:00'}"
+    )
+    lunch: Optional[str] = Field(
+        default=None, description="Lunch break window, e.g., '12:30-13:30'"
+    )
+    no_meetings: Optional[List[str]] = Field(
+        default=None, description="List of time windows to avoid meetings, e.g., ['Fri 14:00-16:00']"
+    )
+    preferred_deep_work: Optional[List[str]] = Field(
+        default=None, description="Preferred deep work windows, e.g., ['09:00-11:00','16:00-18:00']"
+    )
+    avoid_times: Optional[List[str]] = Field(
+        default=None, description="General avoid windows, e.g., ['18:00-21:00']"
+    )
+    notes: Optional[str] = Field(default=None, description="Free-form notes")
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import functools
+from typing import Any, Optional
+
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+TRUE_VALUES = frozenset({"1", "true", "yes", "on", "y"})
+
+
+class Settings(BaseSettings):
+    """Environment/.env configuration, read once per process via get_settings()."""
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+
+    google_api_key: Optional[str] = None
+    gemini_model: str = "gemini-2.5-flash"
+    langsmith_tracing: Optional[str] = None
+    langsmith_endpoint: Optional[str] = None
+    langsmith_project: Optional[str] = None
+    langsmith_api_key: Optional[str] = None
+    cli_banner_color: str = "bright_blue"
+    cli_figlet_font: str = "standard"
+    cli_default_timezone: str = "Etc/UTC"
+    calendar_cli_semantic_cache: bool = False
+    calendar_cli_speculative_prefetch: bool = False
+
+    @field_validator("calendar_cli_semantic_cache", "calendar_cli_speculative_prefetch", mode="before")
+    @classmethod
+    def _parse_flag(cls, value: Any) -> bool:
+        # Unrecognized values turn the opt-in feature off instead of breaking every command
+        if isinstance(value, bool):
+            return value
+        return str(value).strip().lower() in TRUE_VALUES
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+def reload_settings() -> Settings:
+    """Drop the cached settings (e.g. after writing .env) and read them again."""
+    get_settings.cache_clear()
+    return get_settings()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+from typing import Final, Optional
 
 
 DEFAULT_SYSTEM_PROMPT_ENV_KEY = "CALENDAR_CLI_SYSTEM_PROMPT"
 DEFAULT_SYSTEM_PROMPT_PATH = "system_prompt.md"
 
+# Paths known to be missing in this process; cleared when a template is written
+_PROMPT_NEGATIVE: set[str] = set()
+
 
 DEFAULT_SYSTEM_PROMPT_TEMPLATE = """
 # System Prompt (You can edit freely)
@@ -26,6 +29,33 @@ Not: Bu metni değiştirebilir, kendi metodolojinizi yazabilirsiniz.
 """
 
 
+# Built-in instructions always sent to the agent. Kept as one constant so the system
+# prompt prefix is byte-identical between runs (prompt caching keys on the prefix).
+BUILTIN_SYSTEM_INSTRUCTIONS: Final[str] = (
+    "Rol: Sen, insan biyolojisi, sirkadiyen ritim, nörobilim, ergonomi ve üretkenlik konularında uzman "
+    "bir Zaman Yönetimi Danışmanı ve takvim ajanısın. Amaç: Kullanıcının talebini en kısa ve net şekilde "
+    "yanıtlamak ve gerektiğinde takvim üzerinde güvenli işlemler yapmak (oluştur/ara/güncelle/taşı/sil). "
+    "Çakışmaları ve kısıtları kontrol et; izinsiz/yıkıcı değişiklik yapma.\n\n"
+    "Varsayılan iletişim tarzı: Soruyu doğrudan yanıtla; gereksiz tavsiye ve uzun açıklamalardan kaçın. "
+    "Yanıt sonunda yalnızca şu soruyu sor: 'Öneri ve kısa bilimsel açıklama eklememi ister misiniz? (E/H)'. "
+    "Kullanıcı 'E' derse kısaca öneriler + kısa gerekçe ekle; 'H' derse ekleme.\n\n"
+    "Planlama ilkeleri (iç kurallar):\n"
+    "- Biyolojik saat: 09:00–11:00 ve 16:00–18:00 zihinsel zirve; ~14:00 ve geç saatlerde odak azalır.\n"
+    "- Zaman yönetiminin 3 boyutu: Planlama (önemli işleri zirve saatlere koy), Tutum (zaman sınırlı; erteleme), "
+    "Tuzaklar (gereksiz toplantı/habersiz ziyaret/sosyal medya; gerektiğinde 'hayır' de).\n"
+    "- Mola ve sağlık: 20-20-20 göz kuralı; 60–90 dk’da bir 5–10 dk aktif mola; postür değişikliği/esneme.\n"
+    "- Süreç: Günlük zaman kütüğü ile analiz → önem–aciliyet matrisi → uygula → gün sonunda sapmaları değerlendir.\n"
+    "- Görev yerleşimi: Yüksek odak işler zirvede; rutin işler düşük enerji saatlerinde; yaratıcı işler sabah erken "
+    "veya akşam sakin saatlerde (kişisel ritme bağlı).\n"
+    "- Boş zaman verilirse uygun görevlerle doldur; verilmezse alternatif zaman pencereleri sun.\n"
+    "- Birden fazla etkinlik oluşturulacak veya birden fazla etkinlik ID'si sorgulanacaksa tek tek çağırmak yerine "
+    "calendar_batch_create / calendar_batch_get araçlarını kullan.\n\n"
+    "Çıktı davranışı: Kullanıcı açıkça 'günlük plan' isterse 'Saat Bazlı Görev Planı'nı üret. "
+    "Mola/Egzersiz, Göz/Postür, Zorluk Sırası, Bilimsel Açıklama bölümlerini yalnızca kullanıcı 'E' yanıtını verdikten sonra ekle.\n\n"
+    "Güncel tarih-saat her kullanıcı mesajının başında [Zaman] satırında verilir.\n"
+)
+
+
 def get_default_system_prompt_path() -> str:
     return os.getenv(DEFAULT_SYSTEM_PROMPT_ENV_KEY, DEFAULT_SYSTEM_PROMPT_PATH)
 
@@ -36,16 +66,20 @@ def write_default_system_prompt_template(path: Optional[str] = None) -> str:
         return target_path
     with open(target_path, "w", encoding="utf-8") as f:
         f.write(DEFAULT_SYSTEM_PROMPT_TEMPLATE.strip() + "\n")
+    _PROMPT_NEGATIVE.discard(target_path)
     return target_path
 
 
 def load_system_prompt(path: Optional[str] = None) -> Optional[str]:
     target_path = path or get_default_system_prompt_path()
-    if not os.path.exists(target_path):
+    if target_path in _PROMPT_NEGATIVE:
         return None
     try:
         with open(target_path, "r", encoding="utf-8") as f:
             return f.read()
+    except FileNotFoundError:
+        _PROMPT_NEGATIVE.add(target_path)
+        return None
     except Exception:
         return None
 
@@ -0,0 +1,59 @@
+from dotenv import dotenv_values
+
+from calendar_cli.files import bulk_set_env, write_text_atomic
+
+
+def test_bulk_set_env_keeps_multiline_values_exports_and_comments(tmp_path):
+    env = tmp_path / ".env"
+    original = (
+        "# Calendar CLI settings\n"
+        'MULTI="line1\n'
+        'GEMINI_MODEL=fake"\n'
+        "export GOOGLE_API_KEY='old'  # rotate monthly\n"
+        "\n"
+        "GEMINI_MODEL=gemini-2.5-flash\n"
+        "OTHER=keep"
+    )
+    env.write_text(original, encoding="utf-8")
+
+    bulk_set_env(str(env), {"GEMINI_MODEL": "x", "GOOGLE_API_KEY": "new", "LANGSMITH_PROJECT": "demo"})
+
+    text = env.read_text(encoding="utf-8")
+    assert text == (
+        "# Calendar CLI settings\n"
+        'MULTI="line1\n'
+        'GEMINI_MODEL=fake"\n'
+        "export GOOGLE_API_KEY='new'\n"
+        "\n"
+        "GEMINI_MODEL='x'\n"
+        "OTHER=keep\n"
+        "LANGSMITH_PROJECT='demo'\n"
+    )
+    assert dotenv_values(env) == {
+        "MULTI": "line1\nGEMINI_MODEL=fake",
+        "GOOGLE_API_KEY": "new",
+        "GEMINI_MODEL": "x",
+        "OTHER": "keep",
+        "LANGSMITH_PROJECT": "demo",
+    }
+
+
+def test_bulk_set_env_round_trips_quotes_and_backslashes(tmp_path):
+    env = tmp_path / ".env"
+    value = "it's C:\\path\\"
+
+    bulk_set_env(str(env), {"LANGSMITH_API_KEY": value})
+
+    assert dotenv_values(env) == {"LANGSMITH_API_KEY": value}
+
+
+def test_write_text_atomic_keeps_mode_and_leaves_no_temp_files(tmp_path):
+    target = tmp_path / ".env"
+    target.write_text("A=1\n", encoding="utf-8")
+    target.chmod(0o640)
+
+    write_text_atomic(target, "A=2\n")
+
+    assert target.read_text(encoding="utf-8") == "A=2\n"
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]